@@ -0,0 +1,23 @@
+# --- ablation_numba.py --------------------------------------------------------
+# Optional numba-compiled kernels for ablation_tests.py.
+# Importing this module raises ImportError when numba/numpy are unavailable;
+# ablation_tests.py catches that and falls back to NumPy or pure Python.
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def _bootstrap_means(vals, n_boot, seed):
+    # numba does not support Generator/RandomState objects, only the legacy
+    # np.random API. Inside nopython code that API drives numba's own
+    # per-thread state, so seeding here leaves NumPy's global RNG untouched.
+    np.random.seed(seed)
+    n = vals.shape[0]
+    out = np.empty(n_boot)
+    for b in range(n_boot):
+        s = 0.0
+        for _ in range(n):
+            s += vals[np.random.randint(0, n)]
+        out[b] = s / n
+    return out
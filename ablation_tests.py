@@ -4,20 +4,37 @@
 # recorded output_data as the target/ground-truth when available.
 
 from copy import deepcopy
-import math
+from functools import cached_property, lru_cache
+from itertools import zip_longest
 import random
 import statistics
+import sys
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; pure-Python fallbacks are used below
+    np = None
+
+@lru_cache(maxsize=None)
+def _numba_bootstrap_means() -> Optional[Callable]:
+    # Lazily import the optional numba kernel once; None if numba is missing.
+    try:
+        from ablation_numba import _bootstrap_means
+    except ImportError:
+        return None
+    return _bootstrap_means
+
 # -------------------------
 # Generic distance / loss
 # -------------------------
 
-def _is_number(x: Any) -> bool:
-    return isinstance(x, (int, float)) and not (isinstance(x, float) and math.isnan(x))
-
 def _safe_rel_err(a: float, b: float, eps: float = 1e-12) -> float:
-    denom = max(abs(a), abs(b), eps)
+    aa = a if a >= 0.0 else -a
+    ab = b if b >= 0.0 else -b
+    denom = aa if aa > ab else ab
+    if denom < eps:
+        denom = eps
     return abs(a - b) / denom
 
 def _str_sim(a: str, b: str) -> float:
@@ -25,12 +42,46 @@ def _str_sim(a: str, b: str) -> float:
     # Returns [0,1], 1 == identical
     if a == b:
         return 1.0
-    # token overlap Jaccard-ish
-    A = set(str(a))
-    B = set(str(b))
-    if not A and not B:
-        return 1.0
-    return len(A & B) / max(1, len(A | B))
+    # token overlap Jaccard-ish; |A | B| is derived from |A & B| so the
+    # union set is never materialized
+    A = set(a)
+    B = set(b)
+    inter = len(A & B)
+    union = len(A) + len(B) - inter
+    return inter / union if union else 1.0
+
+# Node kinds for generic_distance, keyed on exact type so the common JSON-ish
+# payloads resolve with one dict lookup; subclasses go through _kind_slow.
+_NUM, _STR, _SEQ, _MAP = range(4)
+_KINDS = {int: _NUM, float: _NUM, bool: _NUM, str: _STR, list: _SEQ, tuple: _SEQ, dict: _MAP}
+
+def _kind_slow(x: Any) -> Optional[int]:
+    if isinstance(x, (int, float)):
+        return _NUM
+    if isinstance(x, str):
+        return _STR
+    if isinstance(x, (list, tuple)):
+        return _SEQ
+    if isinstance(x, dict):
+        return _MAP
+    return None
+
+# Same-length numeric sequences at least this long are scored with NumPy ufuncs.
+_NP_MIN_LEN = 32
+_NUM_TYPES = frozenset((int, float, bool))
+
+def _all_numeric(xs: Any) -> bool:
+    return {type(x) for x in xs} <= _NUM_TYPES
+
+def _np_rel_err_mean(a: Any, b: Any, eps: float = 1e-12) -> float:
+    x = np.fromiter(a, dtype=np.float64, count=len(a))
+    y = np.fromiter(b, dtype=np.float64, count=len(b))
+    denom = np.maximum(np.maximum(np.abs(x), np.abs(y)), eps)
+    with np.errstate(invalid="ignore"):
+        d = np.abs(x - y) / denom
+    # NaN is not a number for generic_distance: it only equals nothing (-> 1.0).
+    d[np.isnan(x) | np.isnan(y)] = 1.0
+    return float(d.mean())
 
 def generic_distance(a: Any, b: Any) -> float:
     """
@@ -39,28 +90,56 @@ def generic_distance(a: Any, b: Any) -> float:
     - Strings: 1 - similarity
     - Sequences/Dicts: average element-wise distance (order-sensitive for lists)
     - Fallback: 0 if equal else 1
-    """
-    if _is_number(a) and _is_number(b):
-        return _safe_rel_err(float(a), float(b))
 
-    if isinstance(a, str) or isinstance(b, str):
-        return 1.0 - _str_sim(str(a), str(b))
+    Walks nested containers with an explicit stack; each leaf contributes its
+    distance weighted by the product of 1/len along its path, which equals the
+    nested average without recursing. Nesting deeper than the recursion limit
+    (e.g. a self-referential list) raises RecursionError, as recursing would.
+    """
+    kinds_get = _KINDS.get
+    max_depth = sys.getrecursionlimit()
+    total = 0.0
+    stack = [(a, b, 1.0, 0)]
+    pop = stack.pop
+    push = stack.append
 
-    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
-        n = max(len(a), len(b))
-        if n == 0:
-            return 0.0
-        a_pad = list(a) + [None] * (n - len(a))
-        b_pad = list(b) + [None] * (n - len(b))
-        return sum(generic_distance(x, y) for x, y in zip(a_pad, b_pad)) / n
+    while stack:
+        a, b, w, depth = pop()
+        ka = kinds_get(type(a))
+        if ka is None:
+            ka = _kind_slow(a)
+        kb = kinds_get(type(b))
+        if kb is None:
+            kb = _kind_slow(b)
 
-    if isinstance(a, dict) and isinstance(b, dict):
-        keys = set(a.keys()) | set(b.keys())
-        if not keys:
-            return 0.0
-        return sum(generic_distance(a.get(k), b.get(k)) for k in keys) / len(keys)
+        # a == a is False only for NaN, which is not treated as a number.
+        if ka == _NUM and kb == _NUM and a == a and b == b:
+            total += w * _safe_rel_err(float(a), float(b))
+        elif ka == _STR or kb == _STR:
+            total += w * (1.0 - _str_sim(str(a), str(b)))
+        elif ka == _SEQ and kb == _SEQ:
+            n = len(a) if len(a) > len(b) else len(b)
+            if (n >= _NP_MIN_LEN and np is not None and len(a) == len(b)
+                    and _all_numeric(a) and _all_numeric(b)):
+                total += w * _np_rel_err_mean(a, b)
+            elif n:
+                if depth >= max_depth:
+                    raise RecursionError("generic_distance: containers nested too deeply")
+                cw = w / n
+                for x, y in zip_longest(a, b):
+                    push((x, y, cw, depth + 1))
+        elif ka == _MAP and kb == _MAP:
+            keys = a.keys() | b.keys()
+            if keys:
+                if depth >= max_depth:
+                    raise RecursionError("generic_distance: containers nested too deeply")
+                cw = w / len(keys)
+                for k in keys:
+                    push((a.get(k), b.get(k), cw, depth + 1))
+        elif a != b:
+            total += w
 
-    return 0.0 if a == b else 1.0
+    return total
 
 # -------------------------
 # Ablation result/report
@@ -82,52 +161,133 @@ class AblationRow:
 
 class AblationReport:
     def __init__(self, rows: List[AblationRow]):
-        self.rows = rows
+        self._rows: Optional[List[AblationRow]] = rows
+        self._summarize((r.target_present, r.baseline_loss, r.god_loss) for r in rows)
+
+    @classmethod
+    def from_columns(
+        cls,
+        index: List[int],
+        target_present: List[bool],
+        baseline_loss: List[Optional[float]],
+        god_loss: List[Optional[float]],
+    ) -> "AblationReport":
+        """
+        Build a report from parallel per-example columns without allocating an
+        AblationRow per example. `rows` is materialized lazily on first access.
+        """
+        self = cls.__new__(cls)
+        self._rows = None
+        self._row_columns = (index, target_present, baseline_loss, god_loss)
+        self._summarize(zip(target_present, baseline_loss, god_loss))
+        return self
+
+    def _summarize(self, triples) -> None:
+        # Single pass over (target_present, baseline_loss, god_loss); every
+        # statistic below reads these columns. The report is a snapshot.
+        baseline: List[float] = []
+        god: List[float] = []
+        delta: List[float] = []
+        count = 0
+        wins = 0
+        for present, b, g in triples:
+            if b is not None:
+                baseline.append(b)
+            if g is not None:
+                god.append(g)
+            if b is not None and g is not None:
+                delta.append(b - g)
+                if g < b:
+                    wins += 1
+                if present:
+                    count += 1
+
+        self._columns: Dict[str, List[float]] = {
+            "baseline_loss": baseline,
+            "god_loss": god,
+            "delta": delta,
+        }
+        self._count = count
+        self._wins = wins
+
+    @property
+    def rows(self) -> List[AblationRow]:
+        if self._rows is None:
+            self._rows = [AblationRow(*cols) for cols in zip(*self._row_columns)]
+        return self._rows
 
     def _vals(self, attr: str) -> List[float]:
+        cached = self._columns.get(attr)
+        if cached is not None:
+            return cached
         return [getattr(r, attr) for r in self.rows if getattr(r, attr) is not None]
 
     @property
     def count(self) -> int:
-        return len([r for r in self.rows if r.target_present and r.baseline_loss is not None and r.god_loss is not None])
+        return self._count
 
-    @property
+    @cached_property
     def mean_baseline(self) -> Optional[float]:
-        xs = self._vals("baseline_loss")
+        xs = self._columns["baseline_loss"]
         return statistics.mean(xs) if xs else None
 
-    @property
+    @cached_property
     def mean_god(self) -> Optional[float]:
-        xs = self._vals("god_loss")
+        xs = self._columns["god_loss"]
         return statistics.mean(xs) if xs else None
 
-    @property
+    @cached_property
     def mean_delta(self) -> Optional[float]:
-        ds = self._vals("delta")
+        ds = self._columns["delta"]
         return statistics.mean(ds) if ds else None
 
     @property
     def win_rate(self) -> Optional[float]:
         """Fraction of examples where god_loss < baseline_loss."""
-        good = [r for r in self.rows if r.baseline_loss is not None and r.god_loss is not None]
-        if not good:
+        paired = len(self._columns["delta"])
+        if not paired:
             return None
-        wins = sum(1 for r in good if r.god_loss < r.baseline_loss)
-        return wins / len(good)
+        return self._wins / paired
 
-    def bootstrap_ci(self, n_boot: int = 1000, seed: int = 42, which: str = "delta", alpha: float = 0.05) -> Optional[Tuple[float, float]]:
+    def bootstrap_ci(self, n_boot: int = 1000, seed: int = 42, which: str = "delta", alpha: float = 0.05, use_numba: bool = False) -> Optional[Tuple[float, float]]:
+        # use_numba=True opts into the compiled kernel in ablation_numba. It
+        # draws from a different RNG stream than the default NumPy path, so
+        # it is never picked implicitly: the CI must not depend on whether
+        # numba happens to be installed. Falls back to NumPy without numba.
         vals = self._vals(which)
         if not vals:
             return None
-        random.seed(seed)
+        # Every resample of a constant column has the same mean (this also
+        # covers n == 1), so skip the n_boot draws entirely.
+        v0 = vals[0]
+        if all(v == v0 for v in vals):
+            return (v0, v0)
         n = len(vals)
+        lo_idx = int((alpha/2) * (n_boot - 1))
+        hi_idx = int((1 - alpha/2) * (n_boot - 1))
+
+        if np is not None:
+            arr = np.asarray(vals, dtype=np.float64)
+            kernel = _numba_bootstrap_means() if use_numba else None
+            if kernel is not None:
+                means = kernel(arr, n_boot, seed)
+            else:
+                # Draw every resample at once as an (n_boot, n) index matrix and
+                # reduce along rows instead of looping n_boot*n times in Python.
+                rng = np.random.default_rng(seed)
+                idx = rng.integers(0, n, size=(n_boot, n), dtype=np.int64)
+                means = arr[idx].mean(axis=1)
+            # Only two order statistics are needed: introselect is O(n_boot).
+            means = np.partition(means, (lo_idx, hi_idx))
+            return (float(means[lo_idx]), float(means[hi_idx]))
+
+        # Private generator: never reseed the process-wide `random` state.
+        randrange = random.Random(seed).randrange
         samples = []
         for _ in range(n_boot):
-            draw = [vals[random.randrange(n)] for _ in range(n)]
+            draw = [vals[randrange(n)] for _ in range(n)]
             samples.append(statistics.mean(draw))
         samples.sort()
-        lo_idx = int((alpha/2) * (n_boot - 1))
-        hi_idx = int((1 - alpha/2) * (n_boot - 1))
         return (samples[lo_idx], samples[hi_idx])
 
     def summary(self) -> Dict[str, Any]:
@@ -151,7 +311,8 @@ def run_ablation_suite(
     baseline_fn: Callable[[Any, Dict[str, Any]], Any],    # without God variable
     *,
     loss_fn: Callable[[Any, Any], float] = generic_distance,  # loss(pred, target); lower is better
-    skip_if_no_target: bool = True
+    skip_if_no_target: bool = True,
+    copy_inputs: bool = True
 ) -> AblationReport:
     """
     For each interaction with target (interaction.output_data):
@@ -162,25 +323,41 @@ def run_ablation_suite(
       Record delta = baseline_loss - god_loss  (positive means improvement)
 
     If skip_if_no_target==False, entries without target will be ignored gracefully anyway.
+
+    Each model call receives its own deep copy of input/context so one model
+    cannot leak mutations into the other. Pass copy_inputs=False when both
+    models are known not to mutate their arguments to skip the copies.
     """
-    rows: List[AblationRow] = []
+    # Columnar accumulation: the report only ever reduces over columns.
+    index: List[int] = []
+    present: List[bool] = []
+    baseline_losses: List[Optional[float]] = []
+    god_losses: List[Optional[float]] = []
 
     for idx, inter in enumerate(interactions):
-        x = deepcopy(inter.input_data)
-        ctx = deepcopy(inter.context or {})
         has_target = hasattr(inter, "output_data") and (inter.output_data is not None)
 
         if not has_target and skip_if_no_target:
             continue
 
-        baseline_pred = baseline_fn(deepcopy(x), deepcopy(ctx))
-        god_pred = god_model_fn(deepcopy(x), deepcopy(ctx))
+        x = inter.input_data
+        ctx = inter.context or {}
+
+        if copy_inputs:
+            baseline_pred = baseline_fn(deepcopy(x), deepcopy(ctx))
+            god_pred = god_model_fn(deepcopy(x), deepcopy(ctx))
+        else:
+            baseline_pred = baseline_fn(x, ctx)
+            god_pred = god_model_fn(x, ctx)
 
         baseline_loss = loss_fn(baseline_pred, inter.output_data) if has_target else None
         god_loss = loss_fn(god_pred, inter.output_data) if has_target else None
 
-        rows.append(AblationRow(index=idx, target_present=has_target, baseline_loss=baseline_loss, god_loss=god_loss))
+        index.append(idx)
+        present.append(has_target)
+        baseline_losses.append(baseline_loss)
+        god_losses.append(god_loss)
 
-    return AblationReport(rows)
+    return AblationReport.from_columns(index, present, baseline_losses, god_losses)
 # ------------------------------------------------------------------------------
 # CLAIM: GLB-1 (Global coherence — God Variable must outperform baseline across tasks)
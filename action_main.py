@@ -4,7 +4,7 @@ from __future__ import annotations
 import json
 import os
 import sys
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from godscore_ci.scoring_pipeline import compute_score_pipeline
 
@@ -23,13 +23,14 @@ def _normalize_01(value: str, default: float) -> float:
     return max(0.0, min(1.0, x))
 
 
-def _write_output(key: str, value: str) -> None:
+def _write_outputs(outputs: List[Tuple[str, str]]) -> None:
     path = os.getenv("GITHUB_OUTPUT")
     if not path:
-        print(f"::set-output name={key}::{value}")
+        for key, value in outputs:
+            print(f"::set-output name={key}::{value}")
         return
     with open(path, "a", encoding="utf-8") as f:
-        f.write(f"{key}={value}\n")
+        f.write("".join(f"{key}={value}\n" for key, value in outputs))
 
 
 def main() -> int:
@@ -69,11 +70,13 @@ def main() -> int:
         print(line)
 
     # ---- Outputs ----
-    _write_output("godscore", f"{godscore:.4f}")
-    _write_output("gv", f"{gv:.4f}")
-    _write_output("passed", "true" if passed else "false")
-    _write_output("effective_mode", effective_mode)
-    _write_output("score_source", res.source)
+    _write_outputs([
+        ("godscore", f"{godscore:.4f}"),
+        ("gv", f"{gv:.4f}"),
+        ("passed", "true" if passed else "false"),
+        ("effective_mode", effective_mode),
+        ("score_source", res.source),
+    ])
 
     # ---- JSON Artifact (ALWAYS WRITTEN) ----
     payload = {
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+api/_cache.py
+
+Location of the opt-in on-disk cache shared by the api/ scripts.
+
+Caching is off unless GODSCORE_CACHE_DIR is set. Cache entries are trusted
+by whoever reads them, so a directory is only used when it belongs to the
+current user and nobody else can write to it; anything else (including a
+shared default under /tmp) is ignored rather than risked.
+
+Env:
+  GODSCORE_CACHE_DIR=path   (unset or empty: no on-disk cache)
+"""
+
+from __future__ import annotations
+
+import os
+import stat
+from typing import Optional
+
+
+def _private(path: str, writable_by_others: int) -> bool:
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    getuid = getattr(os, "getuid", None)
+    return (
+        stat.S_ISDIR(st.st_mode)
+        and (getuid is None or st.st_uid == getuid())
+        and not st.st_mode & writable_by_others
+    )
+
+
+def cache_dir(name: str) -> Optional[str]:
+    """
+    GODSCORE_CACHE_DIR/<name>, created 0700 if needed, or None when caching
+    is disabled or either directory is not private to the current user.
+    """
+    base = os.getenv("GODSCORE_CACHE_DIR", "").strip()
+    if not base:
+        return None
+    path = os.path.join(base, name)
+    try:
+        os.makedirs(base, mode=0o700, exist_ok=True)
+        if not _private(base, 0o022):
+            return None
+        os.makedirs(path, mode=0o700, exist_ok=True)
+    except OSError:
+        return None
+    return path if _private(path, 0o077) else None
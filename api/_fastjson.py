@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+api/_fastjson.py
+
+JSON encode/decode helpers shared by the api/ scripts.
+
+Uses orjson when it is installed and falls back to the stdlib json module,
+so every script still runs on a bare Python with no extra packages.
+
+Both paths parse to the same Python objects. orjson refuses NaN/Infinity
+and reads integers beyond 64 bits as floats, so such documents are re-parsed
+with stdlib json; on output it would write NaN/Infinity as null and refuses
+those integers, so such objects are encoded with stdlib json. The written
+text can still differ in float formatting (orjson writes 1e16 and 1e-7,
+stdlib json 1e+16 and 1e-07); both parse back to the same values.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import mmap
+import os
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional accelerator
+    orjson = None
+
+
+# orjson's integer range; outside it, it reads floats and refuses to write.
+_INT_MIN = -(1 << 63)
+_INT_MAX = (1 << 64) - 1
+_BIG_FLOAT = float(1 << 63)
+
+
+def _scalars(obj: Any):
+    """Every non-container value inside `obj`, depth first."""
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        t = type(o)
+        if t is dict:
+            stack.extend(o.values())
+        elif t is list or t is tuple:
+            stack.extend(o)
+        else:
+            yield o
+
+
+def _read_exact(obj: Any) -> bool:
+    """False if orjson may have read an integer beyond 64 bits as a float."""
+    return not any(type(v) is float and abs(v) >= _BIG_FLOAT for v in _scalars(obj))
+
+
+def loads(raw: bytes) -> Any:
+    if orjson is not None:
+        try:
+            obj = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # NaN/Infinity, or truly invalid: stdlib decides which
+        else:
+            if _read_exact(obj):
+                return obj
+    return json.loads(raw)
+
+
+# Below this size a plain read() is cheaper than setting up a mapping.
+MMAP_MIN_BYTES = 64 * 1024
+
+
+def load_file(path: str) -> Any:
+    """
+    Parse the JSON file at `path`. With orjson, files of MMAP_MIN_BYTES or
+    more are mmapped and parsed straight from the page cache, skipping the
+    read() copy into a bytes object.
+    """
+    with open(path, "rb") as f:
+        if orjson is None or os.fstat(f.fileno()).st_size < MMAP_MIN_BYTES:
+            return loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                try:
+                    obj = orjson.loads(view)
+                except orjson.JSONDecodeError:
+                    pass
+                else:
+                    if _read_exact(obj):
+                        return obj
+            return json.loads(mm[:])
+
+
+def _orjson_ok(obj: Any) -> bool:
+    """
+    False without orjson, or if `obj` holds a NaN/Infinity float (orjson
+    would write null) or an integer beyond 64 bits (orjson refuses it).
+    """
+    if orjson is None:
+        return False
+    for v in _scalars(obj):
+        t = type(v)
+        if t is float and not math.isfinite(v):
+            return False
+        if t is int and not _INT_MIN <= v <= _INT_MAX:
+            return False
+    return True
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """2-space indented JSON with a trailing newline."""
+    if _orjson_ok(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def dumps_compact(obj: Any) -> bytes:
+    """
+    Whitespace-free JSON with a trailing newline. Without orjson this is the
+    stdlib's C encoder path (indent=None), far cheaper than dumps_pretty.
+    """
+    if _orjson_ok(obj):
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, separators=(",", ":"), ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def write_atomic(path: str, payload: bytes) -> None:
+    """
+    Write `payload` to a sibling temp file, then os.replace() it over `path`.
+    Readers see either the old file or the complete new one, never a
+    truncated write from a crashed or cancelled run. The bytes go straight
+    to a raw fd; a buffered file object would only copy them once more.
+    """
+    tmp = path + ".tmp"
+    try:
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+api/_policy_cache.py
+
+In-process memo for parsed policy files.
+
+The parsed policy list is kept under (absolute path, mtime_ns, size), so
+repeated loads of an unchanged file within one process skip the read and
+parse. Any change to the file changes the key, so stale entries are simply
+never returned.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any, Dict, List, Tuple
+
+import _fastjson
+
+
+# (abspath, mtime_ns, size) -> policies
+_memo: Dict[Tuple[str, int, int], List[Dict[str, Any]]] = {}
+
+
+def load_policies(path: str) -> List[Dict[str, Any]]:
+    """
+    Returns the policy objects from:
+      { "policies": [ { "id": "...", "tier": 0..3, ... } ] }
+    Non-object entries are dropped. Raises if the file cannot be read/parsed.
+    The returned list is shared between calls; callers must not mutate it.
+    """
+    st = os.stat(path)
+    memo_key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    hit = _memo.get(memo_key)
+    if hit is not None:
+        return hit
+
+    data = _fastjson.load_file(path)
+    policies = data.get("policies", []) if isinstance(data, dict) else []
+    if not isinstance(policies, list):
+        policies = []
+    # Parsed JSON never yields subclasses, so an exact type check is enough.
+    # Well-formed files are all objects: keep the parsed list, don't copy it.
+    if not all(type(p) is dict for p in policies):
+        policies = [p for p in policies if type(p) is dict]
+
+    _memo[memo_key] = policies
+    return policies
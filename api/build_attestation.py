@@ -20,18 +20,31 @@ Example:
 from __future__ import annotations
 
 import base64
-import hashlib
 import hmac
 import json
 import os
 import sys
-from datetime import datetime, timezone
+import time
 from typing import Any, Dict
 
+import _fastjson
+
+
+# Metrics copied into the public attestation, with defaults for missing keys.
+# The default containers are shared: they are only ever serialized.
+PUBLIC_METRIC_DEFAULTS: Dict[str, Any] = {
+    "chi_status": "unknown",
+    "chi_ratio": 0.0,
+    "chi_drift_count": 0,
+    "chi_drift_policy_ids": [],
+    "chi_drift_by_tier": {},
+    "chi_max_drift_tier": 0,
+    "chi_enforced_tiers": [],
+}
+
 
 def load_json(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = _fastjson.load_file(path)
     if not isinstance(data, dict):
         raise ValueError("root must be an object")
     return data
@@ -39,30 +52,19 @@ def load_json(path: str) -> Dict[str, Any]:
 
 def save_json(path: str, data: Dict[str, Any]) -> None:
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-        f.write("\n")
+    _fastjson.write_atomic(path, _fastjson.dumps_pretty(data))
 
 
 def save_text(path: str, text: str) -> None:
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(text)
-        if not text.endswith("\n"):
-            f.write("\n")
+    if not text.endswith("\n"):
+        text += "\n"
+    _fastjson.write_atomic(path, text.encode("utf-8"))
 
 
 def iso_now() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
-
-
-def safe_get(d: Any, keys: list[str], default: Any) -> Any:
-    cur = d
-    for k in keys:
-        if not isinstance(cur, dict) or k not in cur:
-            return default
-        cur = cur[k]
-    return cur
+    # Same format as generate_v1.iso_now: one strftime, no datetime object.
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 
 def canonical_json_bytes(obj: Dict[str, Any]) -> bytes:
@@ -70,13 +72,19 @@ def canonical_json_bytes(obj: Dict[str, Any]) -> bytes:
     Canonical JSON representation:
     - sorted keys
     - no whitespace
+
+    Deliberately stdlib json: signatures must be byte-stable between
+    producers and verifiers regardless of whether orjson is installed, and
+    orjson formats some floats differently (e.g. 1e16 vs 1e+16).
     """
     s = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
     return s.encode("utf-8")
 
 
 def hmac_sha256_b64(secret: str, payload: bytes) -> str:
-    mac = hmac.new(secret.encode("utf-8"), payload, hashlib.sha256).digest()
+    # One-shot hmac.digest with a digest *name* goes straight to OpenSSL's
+    # HMAC (SHA-NI/AVX2 where the CPU has them) without building an HMAC object.
+    mac = hmac.digest(secret.encode("utf-8"), payload, "sha256")
     return base64.b64encode(mac).decode("utf-8")
 
 
@@ -91,40 +99,32 @@ def main(argv: list[str]) -> int:
 
     data = load_json(in_path)
 
-    version = safe_get(data, ["version"], "1.0.0")
-    generated_at = safe_get(data, ["generated_at"], iso_now())
-    ctx_repo = safe_get(data, ["context", "repo"], "unknown")
-    ctx_ref = safe_get(data, ["context", "ref"], "unknown")
-    ctx_sha = safe_get(data, ["context", "sha"], "unknown")
-    ctx_run_id = safe_get(data, ["context", "run_id"], "unknown")
+    version = data.get("version", "1.0.0")
+    generated_at = data["generated_at"] if "generated_at" in data else iso_now()
 
-    outputs = safe_get(data, ["outputs"], {})
+    ctx = data.get("context")
+    if not isinstance(ctx, dict):
+        ctx = {}
+
+    outputs = data.get("outputs")
     if not isinstance(outputs, dict):
         outputs = {}
 
-    metrics = safe_get(outputs, ["metrics"], {})
+    metrics = outputs.get("metrics")
     if not isinstance(metrics, dict):
         metrics = {}
 
-    public_metrics = {
-        "chi_status": metrics.get("chi_status", "unknown"),
-        "chi_ratio": metrics.get("chi_ratio", 0.0),
-        "chi_drift_count": metrics.get("chi_drift_count", 0),
-        "chi_drift_policy_ids": metrics.get("chi_drift_policy_ids", []),
-        "chi_drift_by_tier": metrics.get("chi_drift_by_tier", {}),
-        "chi_max_drift_tier": metrics.get("chi_max_drift_tier", 0),
-        "chi_enforced_tiers": metrics.get("chi_enforced_tiers", []),
-    }
+    public_metrics = {k: metrics.get(k, v) for k, v in PUBLIC_METRIC_DEFAULTS.items()}
 
     attestation: Dict[str, Any] = {
         "attestation_version": "v1",
         "producer": "godscore-ci",
         "generated_at": generated_at,
         "source": {
-            "repo": ctx_repo,
-            "ref": ctx_ref,
-            "sha": ctx_sha,
-            "run_id": ctx_run_id,
+            "repo": ctx.get("repo", "unknown"),
+            "ref": ctx.get("ref", "unknown"),
+            "sha": ctx.get("sha", "unknown"),
+            "run_id": ctx.get("run_id", "unknown"),
         },
         "result": {
             "score": outputs.get("score", 0),
@@ -146,8 +146,8 @@ def main(argv: list[str]) -> int:
     secret = os.getenv("GODSCORE_ATTESTATION_HMAC", "").strip()
 
     if secret:
-        unsigned = dict(attestation)  # shallow copy ok (signature not present yet)
-        payload = canonical_json_bytes(unsigned)
+        # Sign before the signature field exists; no copy of the dict needed.
+        payload = canonical_json_bytes(attestation)
         sig_b64 = hmac_sha256_b64(secret, payload)
 
         attestation["signature"] = {
@@ -9,7 +9,7 @@ Reads:
 - Policy file (default: api/policy.v1.json)
 
 Behavior:
-- If GODSCORE_CHI_ENFORCE=false -> PASS
+- If GODSCORE_CHI_ENFORCE=false -> PASS (output JSON is not read)
 - If enforce=true:
     - If chi_status == drifting:
         - Fail ONLY if any drifted policy has tier >= GODSCORE_CHI_MIN_TIER
@@ -23,76 +23,62 @@ Env:
   GODSCORE_CHI_ALLOW_UNKNOWN=true|false  (default true)
   GODSCORE_POLICY_PATH=path              (default api/policy.v1.json)
   GODSCORE_CHI_MIN_TIER=int              (default 2)
+  GODSCORE_CHI_FAST_FAIL=true|false      (default false; stop at first failing policy)
 """
 
 from __future__ import annotations
 
-import json
 import os
 import sys
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+# _fastjson and _policy_cache (orjson, mmap, json) are imported
+# where they are used: the usage and enforce=false paths never need them.
 
 
 def load_json(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    import _fastjson
+
+    data = _fastjson.load_file(path)
     if not isinstance(data, dict):
         raise ValueError("root must be an object")
     return data
 
 
+_TRUTHY = frozenset(("1", "true", "yes", "y", "on"))
+
+
 def env_bool(name: str, default: bool) -> bool:
-    v = os.getenv(name)
+    v = os.environ.get(name)
     if v is None:
         return default
-    v = v.strip().lower()
-    return v in ("1", "true", "yes", "y", "on")
+    return v in _TRUTHY or v.strip().lower() in _TRUTHY
 
 
 def env_int(name: str, default: int) -> int:
-    v = os.getenv(name)
-    if v is None or v.strip() == "":
+    v = os.environ.get(name, "").strip()
+    if not v:
         return default
     try:
-        return int(v.strip())
-    except Exception:
+        return int(v)
+    except ValueError:
         return default
 
 
-def safe_get(d: Any, keys: List[str], default: Any) -> Any:
-    cur = d
-    for k in keys:
-        if not isinstance(cur, dict) or k not in cur:
-            return default
-        cur = cur[k]
-    return cur
-
-
 def load_policy_index(path: str) -> Dict[str, Dict[str, Any]]:
     """
     Returns {policy_id: policy_obj}
     Accepts:
       { "policies": [ { "id": "...", "tier": 0..3, ... } ] }
     """
+    import _policy_cache
+
     try:
-        data = load_json(path)
-    except FileNotFoundError:
-        return {}
+        policies = _policy_cache.load_policies(path)
     except Exception:
         return {}
 
-    policies = data.get("policies", [])
-    if not isinstance(policies, list):
-        return {}
-
-    idx: Dict[str, Dict[str, Any]] = {}
-    for p in policies:
-        if not isinstance(p, dict):
-            continue
-        pid = p.get("id")
-        if isinstance(pid, str) and pid:
-            idx[pid] = p
-    return idx
+    return {p["id"]: p for p in policies if type(p.get("id")) is str and p["id"]}
 
 
 def policy_tier(policy_obj: Optional[Dict[str, Any]]) -> int:
@@ -109,6 +95,11 @@ def policy_tier(policy_obj: Optional[Dict[str, Any]]) -> int:
         return 0
 
 
+def emit(lines: List[str]) -> None:
+    """Write the whole log block with one stdout write instead of a print per line."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def main(argv: List[str]) -> int:
     if len(argv) != 2:
         print("Usage: python api/chi_gate.py <output.json>")
@@ -120,72 +111,88 @@ def main(argv: List[str]) -> int:
     allow_unknown = env_bool("GODSCORE_CHI_ALLOW_UNKNOWN", True)
     policy_path = os.getenv("GODSCORE_POLICY_PATH", "api/policy.v1.json")
     min_tier = env_int("GODSCORE_CHI_MIN_TIER", 2)
+    fast_fail = env_bool("GODSCORE_CHI_FAST_FAIL", False)
+
+    # Common CI case: nothing to enforce, so don't read or parse anything.
+    if not enforce:
+        emit([
+            f"[chi-gate] output: {out_path} (not read)",
+            f"[chi-gate] enforce: {enforce}",
+            "[chi-gate] enforcement disabled -> PASS",
+        ])
+        return 0
 
     data = load_json(out_path)
 
-    repo = safe_get(data, ["context", "repo"], "unknown")
-    sha = safe_get(data, ["context", "sha"], "unknown")
+    ctx = data.get("context")
+    if not isinstance(ctx, dict):
+        ctx = {}
+    repo = ctx.get("repo", "unknown")
+    sha = ctx.get("sha", "unknown")
 
-    metrics = safe_get(data, ["outputs", "metrics"], {})
+    outputs = data.get("outputs")
+    metrics = outputs.get("metrics") if isinstance(outputs, dict) else None
     if not isinstance(metrics, dict):
         metrics = {}
 
     chi_status = metrics.get("chi_status", "unknown")
     chi_ratio = metrics.get("chi_ratio", 0.0)
-    drift_ids = metrics.get("chi_drift_policy_ids", [])
-    if not isinstance(drift_ids, list):
-        drift_ids = []
-
-    print("[chi-gate] repo:", repo)
-    print("[chi-gate] sha:", sha)
-    print("[chi-gate] enforce:", enforce)
-    print("[chi-gate] policy_path:", policy_path)
-    print("[chi-gate] min_tier:", min_tier)
-    print("[chi-gate] status:", chi_status)
-    print("[chi-gate] ratio:", chi_ratio)
-    print("[chi-gate] drifted_policies:", drift_ids)
-
-    if not enforce:
-        print("[chi-gate] enforcement disabled -> PASS")
-        return 0
+    raw_ids = metrics.get("chi_drift_policy_ids", [])
+    if not isinstance(raw_ids, list):
+        raw_ids = []
+    # Filter once so the scan below needs no per-element type guard.
+    drift_ids = [pid for pid in raw_ids if type(pid) is str and pid]
+
+    lines = [
+        f"[chi-gate] repo: {repo}",
+        f"[chi-gate] sha: {sha}",
+        f"[chi-gate] enforce: {enforce}",
+        f"[chi-gate] policy_path: {policy_path}",
+        f"[chi-gate] min_tier: {min_tier}",
+        f"[chi-gate] status: {chi_status}",
+        f"[chi-gate] ratio: {chi_ratio}",
+        f"[chi-gate] drifted_policies: {raw_ids}",
+    ]
 
     if chi_status == "unknown" and allow_unknown:
-        print("[chi-gate] status unknown and allow_unknown=true -> PASS")
+        lines.append("[chi-gate] status unknown and allow_unknown=true -> PASS")
+        emit(lines)
         return 0
 
     if chi_status != "drifting":
-        print("[chi-gate] CHI not drifting -> PASS")
+        lines.append("[chi-gate] CHI not drifting -> PASS")
+        emit(lines)
         return 0
 
-    # CHI drifting: enforce only for drifted policies at/above min tier
-    pol_idx = load_policy_index(policy_path)
+    # CHI drifting: enforce only for drifted policies at/above min tier.
+    # With no drift ids there is nothing to look up, so skip the policy file.
+    pol_idx = load_policy_index(policy_path) if drift_ids else {}
 
-    hits: List[str] = []
+    hits: List[Tuple[str, int]] = []
     unknown: List[str] = []
 
     for pid in drift_ids:
-        if not isinstance(pid, str) or not pid:
-            continue
         pobj = pol_idx.get(pid)
         if pobj is None:
             unknown.append(pid)
             continue
         t = policy_tier(pobj)
         if t >= min_tier:
-            hits.append(pid)
+            hits.append((pid, t))
+            if fast_fail:
+                break
 
     if hits:
-        print("[chi-gate] FAIL: drift includes policies at/above min tier:")
-        for pid in hits:
-            t = policy_tier(pol_idx.get(pid))
-            print(f" - {pid} (tier {t})")
+        lines.append("[chi-gate] FAIL: drift includes policies at/above min tier:")
+        lines.extend(f" - {pid} (tier {t})" for pid, t in hits)
+        emit(lines)
         return 1
 
-    print("[chi-gate] PASS: drifting only below min tier")
+    lines.append("[chi-gate] PASS: drifting only below min tier")
     if unknown:
-        print("[chi-gate] note: drifted policies not found in policy file (treated as tier 0):")
-        for pid in unknown:
-            print(" -", pid)
+        lines.append("[chi-gate] note: drifted policies not found in policy file (treated as tier 0):")
+        lines.extend(f" - {pid}" for pid in unknown)
+    emit(lines)
     return 0
 
 
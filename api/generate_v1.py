@@ -12,47 +12,57 @@ Modes:
 2) Extend mode:
    generate_v1.py
    - extends existing output in-place
+
+Env:
+  GODSCORE_POLICY_PATH=path   (default api/policy.v1.json)
+  GODSCORE_PRETTY=1|0         (default 1; 0 writes compact JSON for
+                               machine-only consumers such as chi_gate)
+  GODSCORE_VALIDATE=1|0       (default 0; 1 checks the API v1 contract
+                               before writing, so a bad artifact is never saved)
 """
 
 from __future__ import annotations
 
-import json
 import os
 import sys
-from datetime import datetime, timezone
-from typing import Any, Dict
+import time
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, List
+
+import _fastjson
+import _policy_cache
 
 
 def load_json(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _fastjson.load_file(path)
 
 
 def save_json(path: str, data: Dict[str, Any]) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-        f.write("\n")
+    pretty = os.getenv("GODSCORE_PRETTY", "1").strip() != "0"
+    dumps = _fastjson.dumps_pretty if pretty else _fastjson.dumps_compact
+    _fastjson.write_atomic(path, dumps(data))
 
 
 def iso_now() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    # Same "YYYY-MM-DDTHH:MM:SSZ" text as the datetime isoformat() route,
+    # from one C-level strftime call and no tz-aware datetime object.
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 
 def load_policies(path: str) -> Dict[str, Dict[str, Any]]:
     try:
-        data = load_json(path)
+        policies = _policy_cache.load_policies(path)
     except Exception:
         return {}
-    return {
-        p["id"]: p
-        for p in data.get("policies", [])
-        if isinstance(p, dict) and "id" in p
-    }
+    return {p["id"]: p for p in policies if type(p.get("id")) is str and p["id"]}
 
 
 def policy_tier(p: Dict[str, Any]) -> int:
+    t = p.get("tier", 0)
+    if type(t) is int:  # the usual case; skips int() and the try block
+        return t
     try:
-        return int(p.get("tier", 0))
+        return int(t)
     except Exception:
         return 0
 
@@ -77,22 +87,30 @@ def extend_with_tiers(data: Dict[str, Any]) -> None:
 
     drift_ids = metrics.get("chi_drift_policy_ids", [])
 
-    drift_by_tier: Dict[str, list[str]] = {}
-    enforced_tiers = set()
+    # One pass over policies; drifted ids then resolve tiers by lookup.
+    tiers = {pid: policy_tier(p) for pid, p in policies.items()}
+
+    drift_by_tier: DefaultDict[str, List[str]] = defaultdict(list)
     max_tier = 0
 
     for pid in drift_ids:
-        p = policies.get(pid)
-        tier = policy_tier(p) if p else 0
-        drift_by_tier.setdefault(str(tier), []).append(pid)
-        max_tier = max(max_tier, tier)
-
-    for p in policies.values():
-        enforced_tiers.add(policy_tier(p))
+        tier = tiers.get(pid, 0)
+        drift_by_tier[str(tier)].append(pid)
+        if tier > max_tier:
+            max_tier = tier
 
-    metrics["chi_drift_by_tier"] = drift_by_tier
+    metrics["chi_drift_by_tier"] = dict(drift_by_tier)
     metrics["chi_max_drift_tier"] = max_tier
-    metrics["chi_enforced_tiers"] = sorted(enforced_tiers)
+    metrics["chi_enforced_tiers"] = sorted(set(tiers.values()))
+
+
+def check_contract(data: Dict[str, Any]) -> None:
+    if os.getenv("GODSCORE_VALIDATE", "0").strip() != "1":
+        return
+    # Imported here so runs without the flag never load the validator.
+    import validate_v1
+
+    validate_v1.check(data)
 
 
 def main() -> None:
@@ -102,6 +120,7 @@ def main() -> None:
         data = load_json(input_path)
         data["generated_at"] = iso_now()
         extend_with_tiers(data)
+        check_contract(data)
         save_json(output_path, data)
         return
 
@@ -109,6 +128,7 @@ def main() -> None:
     output_path = "api/out/godscore.output.v1.json"
     data = load_json(output_path)
     extend_with_tiers(data)
+    check_contract(data)
     save_json(output_path, data)
 
 
@@ -12,27 +12,22 @@ Usage:
 
 from __future__ import annotations
 
-import json
 import os
 import sys
 from typing import Any, Dict, List
 
+import _fastjson
+
 
 def load_json(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = _fastjson.load_file(path)
     if not isinstance(data, dict):
         raise ValueError("root must be an object")
     return data
 
 
-def safe_get(d: Any, path: List[str], default: Any) -> Any:
-    cur = d
-    for p in path:
-        if not isinstance(cur, dict) or p not in cur:
-            return default
-        cur = cur[p]
-    return cur
+def as_dict(x: Any) -> Dict[str, Any]:
+    return x if isinstance(x, dict) else {}
 
 
 def fmt_ratio(val: Any) -> str:
@@ -50,14 +45,14 @@ def main(argv: List[str]) -> int:
     out_path = argv[1]
     data = load_json(out_path)
 
-    version = safe_get(data, ["version"], "unknown")
-    generated_at = safe_get(data, ["generated_at"], "unknown")
-    repo = safe_get(data, ["context", "repo"], "unknown")
-    sha = safe_get(data, ["context", "sha"], "unknown")
+    version = data.get("version", "unknown")
+    generated_at = data.get("generated_at", "unknown")
+    ctx = as_dict(data.get("context"))
+    repo = ctx.get("repo", "unknown")
+    sha = ctx.get("sha", "unknown")
 
-    metrics = safe_get(data, ["outputs", "metrics"], {})
-    if not isinstance(metrics, dict):
-        metrics = {}
+    outputs = as_dict(data.get("outputs"))
+    metrics = as_dict(outputs.get("metrics"))
 
     chi_status = metrics.get("chi_status", "unknown")
     chi_ratio = fmt_ratio(metrics.get("chi_ratio", 0.0))
@@ -69,7 +64,7 @@ def main(argv: List[str]) -> int:
     if not isinstance(drift_ids, list):
         drift_ids = []
 
-    todos = safe_get(data, ["outputs", "todos"], [])
+    todos = outputs.get("todos", [])
     if not isinstance(todos, list):
         todos = []
 
@@ -120,39 +115,42 @@ def main(argv: List[str]) -> int:
     # --------------------
     summary_path = os.getenv("GITHUB_STEP_SUMMARY")
     if summary_path:
+        # Assemble the whole block, then append it with a single write.
+        parts = [
+            "## 🧭 GodScore CI Summary\n\n",
+            f"**Repo:** `{repo}`  \n",
+            f"**SHA:** `{sha}`  \n",
+            f"**Generated:** `{generated_at}`  \n\n",
+            "### Constraint Honesty Index (CHI)\n\n",
+            "| Metric | Value |\n",
+            "|------|-------|\n",
+            f"| Status | **{chi_status}** |\n",
+            f"| Ratio | `{chi_ratio}` |\n",
+            f"| Policies | `{chi_policy_count}` |\n",
+            f"| Enforced | `{chi_enforced_count}` |\n",
+            f"| Drift | `{chi_drift_count}` |\n\n",
+        ]
+
+        if drift_ids:
+            parts.append("### ⚠️ Drifted Policies\n\n")
+            parts.extend(f"- `{pid}`\n" for pid in drift_ids[:20])
+            parts.append("\n")
+
+        parts.append("### ✅ Next Actions\n\n")
+        if not todos:
+            parts.append("- No open todos 🎉\n")
+        else:
+            for td in todos[:10]:
+                if not isinstance(td, dict):
+                    continue
+                title = td.get("title", "untitled")
+                priority = td.get("priority", "low")
+                status = td.get("status", "open")
+                parts.append(f"- **[{status}] ({priority})** {title}\n")
+        parts.append("\n---\n")
+
         with open(summary_path, "a", encoding="utf-8") as f:
-            f.write("## 🧭 GodScore CI Summary\n\n")
-            f.write(f"**Repo:** `{repo}`  \n")
-            f.write(f"**SHA:** `{sha}`  \n")
-            f.write(f"**Generated:** `{generated_at}`  \n\n")
-
-            f.write("### Constraint Honesty Index (CHI)\n\n")
-            f.write("| Metric | Value |\n")
-            f.write("|------|-------|\n")
-            f.write(f"| Status | **{chi_status}** |\n")
-            f.write(f"| Ratio | `{chi_ratio}` |\n")
-            f.write(f"| Policies | `{chi_policy_count}` |\n")
-            f.write(f"| Enforced | `{chi_enforced_count}` |\n")
-            f.write(f"| Drift | `{chi_drift_count}` |\n\n")
-
-            if drift_ids:
-                f.write("### ⚠️ Drifted Policies\n\n")
-                for pid in drift_ids[:20]:
-                    f.write(f"- `{pid}`\n")
-                f.write("\n")
-
-            f.write("### ✅ Next Actions\n\n")
-            if not todos:
-                f.write("- No open todos 🎉\n")
-            else:
-                for td in todos[:10]:
-                    if not isinstance(td, dict):
-                        continue
-                    title = td.get("title", "untitled")
-                    priority = td.get("priority", "low")
-                    status = td.get("status", "open")
-                    f.write(f"- **[{status}] ({priority})** {title}\n")
-            f.write("\n---\n")
+            f.write("".join(parts))
 
     return 0
 
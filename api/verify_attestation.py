@@ -13,26 +13,23 @@ Returns exit 0 if valid, exit 1 if invalid.
 from __future__ import annotations
 
 import base64
-import hashlib
+import binascii
 import hmac
-import json
 import sys
 from typing import Any, Dict
 
-
-def load_json(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+import _fastjson
+# The signer's own canonical form, so both sides always hash the same bytes.
+from build_attestation import canonical_json_bytes
 
 
-def canonical_json_bytes(obj: Dict[str, Any]) -> bytes:
-    s = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
-    return s.encode("utf-8")
+def load_json(path: str) -> Dict[str, Any]:
+    return _fastjson.load_file(path)
 
 
-def hmac_sha256_b64(secret: str, payload: bytes) -> str:
-    mac = hmac.new(secret.encode("utf-8"), payload, hashlib.sha256).digest()
-    return base64.b64encode(mac).decode("utf-8")
+def hmac_sha256(secret: str, payload: bytes) -> bytes:
+    # One-shot OpenSSL HMAC, no HMAC object.
+    return hmac.digest(secret.encode("utf-8"), payload, "sha256")
 
 
 def main(argv: list[str]) -> int:
@@ -55,13 +52,19 @@ def main(argv: list[str]) -> int:
         print("❌ Signature value missing/empty")
         return 1
 
-    # Remove signature for verification
-    unsigned = dict(a)
-    unsigned.pop("signature", None)
+    # Remove signature for verification; `a` is ours, so no copy is needed.
+    del a["signature"]
+
+    try:
+        got = base64.b64decode(sig_val, validate=True)
+    except binascii.Error:
+        print("❌ Signature invalid")
+        return 1
 
-    expected = hmac_sha256_b64(secret, canonical_json_bytes(unsigned))
+    # Compare the raw 32-byte digests rather than their base64 text.
+    expected = hmac_sha256(secret, canonical_json_bytes(a))
 
-    if hmac.compare_digest(expected, sig_val):
+    if hmac.compare_digest(expected, got):
         print("✅ Signature valid")
         return 0
 
@@ -5,7 +5,7 @@ import os
 import re
 import subprocess
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -15,37 +15,54 @@ class AutoScoreV1Result:
     notes: List[str]              # simple human-readable reasons
 
 
-def _run(cmd: List[str]) -> str:
-    return subprocess.check_output(cmd, text=True, stderr=subprocess.STDOUT).strip()
+def _run_concurrently(cmds: List[List[str]]) -> List[Optional[str]]:
+    """
+    Start every command before waiting on any, so the git calls overlap
+    instead of paying process start-up and repo discovery one after another.
+    Returns each command's stripped stdout, or None where it failed.
+    """
+    procs: List[Optional[subprocess.Popen]] = []
+    for cmd in cmds:
+        try:
+            procs.append(
+                subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+            )
+        except OSError:
+            procs.append(None)
+
+    outs: List[Optional[str]] = []
+    for p in procs:
+        if p is None:
+            outs.append(None)
+            continue
+        out, _ = p.communicate()
+        outs.append(out.strip() if p.returncode == 0 else None)
+    return outs
 
 
 def _clamp01(x: float) -> float:
     return max(0.0, min(1.0, x))
 
 
-def _guess_base_head() -> Tuple[str, str]:
+def _env_base_head() -> Tuple[Optional[str], str]:
+    """
+    Returns: (base or None, head). None means "previous commit", which the
+    caller resolves with git alongside its other git calls.
+    """
     head = os.getenv("GITHUB_SHA") or "HEAD"
 
     base = os.getenv("GITHUB_EVENT_BEFORE")
     if not base or base == "0000000000000000000000000000000000000000":
         # fallback to previous commit if event payload doesn't provide base
-        try:
-            base = _run(["git", "rev-parse", "HEAD~1"])
-        except Exception:
-            base = head  # single-commit repo edge case
+        return None, head
 
     return base, head
 
 
-def _diff_numstat(base: str, head: str) -> Tuple[int, int, List[str]]:
+def _parse_numstat(out: str) -> Tuple[int, int, List[str]]:
     """
     Returns: (added_lines, deleted_lines, changed_files)
     """
-    try:
-        out = _run(["git", "diff", "--numstat", f"{base}..{head}"])
-    except Exception:
-        return 0, 0, []
-
     added = 0
     deleted = 0
     files: List[str] = []
@@ -68,11 +85,25 @@ def _diff_numstat(base: str, head: str) -> Tuple[int, int, List[str]]:
     return added, deleted, files
 
 
-def _commit_message_lower() -> str:
-    try:
-        return _run(["git", "log", "-1", "--pretty=%B"]).lower()
-    except Exception:
-        return ""
+def _git_facts(base: Optional[str], head: str) -> Tuple[str, str, str]:
+    """
+    Returns: (base, numstat, lowercased HEAD commit message), from one
+    concurrent round of git calls. A missing base is the previous commit;
+    if that does not exist (single-commit repo) base falls back to head and
+    the diff is empty.
+    """
+    rev = base or "HEAD~1"
+    cmds = [
+        ["git", "diff", "--numstat", f"{rev}..{head}"],
+        ["git", "log", "-1", "--pretty=%B"],
+    ]
+    if base is None:
+        cmds.append(["git", "rev-parse", "HEAD~1"])
+
+    numstat, msg, *parent = _run_concurrently(cmds)
+    if base is None:
+        base = parent[0] or head
+    return base, numstat or "", (msg or "").lower()
 
 
 def _docs_only(files: List[str]) -> bool:
@@ -132,11 +163,11 @@ def _penalty_from_loc_changed(changed_loc: int) -> float:
 
 
 def compute_autoscore_v1(base_sha: str | None = None, head_sha: str | None = None) -> AutoScoreV1Result:
-    base, head = (base_sha, head_sha) if base_sha and head_sha else _guess_base_head()
-    added, deleted, files = _diff_numstat(base, head)
+    base, head = (base_sha, head_sha) if base_sha and head_sha else _env_base_head()
+    base, numstat, msg = _git_facts(base, head)
+    added, deleted, files = _parse_numstat(numstat)
     changed_loc = added + deleted
 
-    msg = _commit_message_lower()
     docs_only = _docs_only(files)
     risky, high_risk = _risky_paths_hit(files)
     tests_detected = _has_test_signals(files)
@@ -0,0 +1,12 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# The root modules (ablation_tests, autoscore_v1, godscore, ...) are not part
+# of the installed package, and the api/ scripts run as `python api/x.py` and
+# import their siblings as top-level modules; make the tests see both the
+# same way, whatever directory pytest is started from.
+for path in (str(ROOT), str(ROOT / "api")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
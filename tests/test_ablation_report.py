@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import pytest
+
+import ablation_tests
+from ablation_tests import AblationReport, AblationRow
+
+
+def _report() -> AblationReport:
+    rows = [AblationRow(i, True, float(i % 7), float(i % 5)) for i in range(50)]
+    return AblationReport(rows)
+
+
+def test_bootstrap_ci_brackets_mean_delta():
+    report = _report()
+    lo, hi = report.bootstrap_ci()
+    assert lo <= report.mean_delta <= hi
+
+
+def test_bootstrap_ci_is_deterministic_for_seed():
+    report = _report()
+    assert report.bootstrap_ci(seed=7) == report.bootstrap_ci(seed=7)
+
+
+def test_bootstrap_ci_pure_python_fallback(monkeypatch):
+    monkeypatch.setattr(ablation_tests, "np", None)
+    report = _report()
+    lo, hi = report.bootstrap_ci()
+    assert lo <= report.mean_delta <= hi
+
+
+def test_bootstrap_ci_empty_report():
+    assert AblationReport([]).bootstrap_ci() is None
+
+
+@pytest.mark.skipif(ablation_tests.np is None, reason="numpy not installed")
+def test_bootstrap_ci_returns_python_floats():
+    lo, hi = _report().bootstrap_ci()
+    assert type(lo) is float and type(hi) is float
+
+
+def test_bootstrap_ci_default_ignores_numba(monkeypatch):
+    def _boom():
+        raise AssertionError("numba kernel used without opting in")
+
+    monkeypatch.setattr(ablation_tests, "_numba_bootstrap_means", _boom)
+    lo, hi = _report().bootstrap_ci()
+    assert lo <= hi
+
+
+def test_bootstrap_ci_numba_kernel():
+    pytest.importorskip("numba")
+    report = _report()
+    lo, hi = report.bootstrap_ci(seed=7, use_numba=True)
+    assert lo <= report.mean_delta <= hi
+    assert report.bootstrap_ci(seed=7, use_numba=True) == (lo, hi)
+
+
+class _Interaction:
+    def __init__(self, input_data, context, output_data):
+        self.input_data = input_data
+        self.context = context
+        self.output_data = output_data
+
+
+def test_run_ablation_suite_isolates_model_inputs():
+    inter = _Interaction({"xs": [1, 2]}, {"k": 1}, 3.0)
+
+    def mutating_model(x, ctx):
+        x["xs"].append(99)
+        return float(len(x["xs"]))
+
+    report = ablation_tests.run_ablation_suite([inter], mutating_model, mutating_model)
+    assert inter.input_data == {"xs": [1, 2]}
+    assert report.mean_delta == 0.0
+
+
+def test_generic_distance_nested_average():
+    a = {"x": [1.0, "abc"], "y": 2}
+    b = {"x": [1.0, "abc"], "y": 4}
+    # "y" differs by relative error 0.5; it carries half the dict weight.
+    assert ablation_tests.generic_distance(a, b) == pytest.approx(0.25)
+    assert ablation_tests.generic_distance([], ()) == 0.0
+    assert ablation_tests.generic_distance([1, 2], [1]) == pytest.approx(0.5)
+
+
+def test_generic_distance_self_referential_raises():
+    x = []
+    x.append(x)
+    d = {}
+    d["d"] = d
+    with pytest.raises(RecursionError):
+        ablation_tests.generic_distance(x, [[[x]]])
+    with pytest.raises(RecursionError):
+        ablation_tests.generic_distance(d, {"d": d})
+
+
+def test_generic_distance_long_numeric_lists_match_elementwise():
+    a = [float(i) for i in range(64)]
+    b = [float(i) * 1.5 for i in range(64)]
+    expected = sum(ablation_tests._safe_rel_err(x, y) for x, y in zip(a, b)) / 64
+    assert ablation_tests.generic_distance(a, b) == pytest.approx(expected)
+
+
+def test_from_columns_matches_row_report():
+    spec = [(0, True, 1.0, 0.5), (1, True, None, 0.2), (2, False, 0.3, 0.9)]
+    by_rows = AblationReport([AblationRow(*r) for r in spec])
+    by_cols = AblationReport.from_columns(*map(list, zip(*spec)))
+    assert by_cols.summary() == by_rows.summary()
+    assert [r.delta for r in by_cols.rows] == [r.delta for r in by_rows.rows]
+
+
+def test_bootstrap_ci_constant_values_short_circuit():
+    rows = [AblationRow(i, True, 1.0, 0.75) for i in range(5)]
+    assert AblationReport(rows).bootstrap_ci() == (0.25, 0.25)
+    assert AblationReport(rows[:1]).bootstrap_ci() == (0.25, 0.25)
+
+
+def test_bootstrap_ci_leaves_global_random_state_alone(monkeypatch):
+    import random
+
+    monkeypatch.setattr(ablation_tests, "np", None)
+    random.seed(123)
+    expected = random.random()
+    random.seed(123)
+    _report().bootstrap_ci()
+    assert random.random() == expected
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import base64
+import hmac
+import json
+
+import build_attestation
+
+OUTPUT = {
+    "version": "1.0.0",
+    "generated_at": "2026-01-01T00:00:00Z",
+    "context": {"repo": "o/r", "sha": "abc"},
+    "outputs": {"score": 90, "metrics": {"chi_status": "honest", "chi_ratio": 1.0}},
+}
+
+
+def test_signed_attestation_round_trips(tmp_path, monkeypatch):
+    src = tmp_path / "out.json"
+    src.write_text(json.dumps(OUTPUT))
+    dest = tmp_path / "att" / "godscore.json"
+    monkeypatch.setenv("GODSCORE_ATTESTATION_HMAC", "s3cret")
+
+    assert build_attestation.main(["build_attestation.py", str(src), str(dest)]) == 0
+
+    att = json.loads(dest.read_text())
+    sig = att.pop("signature")["value"]
+    expected = hmac.digest(b"s3cret", build_attestation.canonical_json_bytes(att), "sha256")
+    assert base64.b64decode(sig) == expected
+    assert (tmp_path / "att" / "godscore.json.sig").read_text() == sig + "\n"
+    assert sorted(p.name for p in dest.parent.iterdir()) == ["godscore.json", "godscore.json.sig"]
+
+
+def test_unsigned_attestation_writes_empty_sig(tmp_path, monkeypatch):
+    src = tmp_path / "out.json"
+    src.write_text(json.dumps(OUTPUT))
+    dest = tmp_path / "godscore.json"
+    monkeypatch.delenv("GODSCORE_ATTESTATION_HMAC", raising=False)
+
+    assert build_attestation.main(["build_attestation.py", str(src), str(dest)]) == 0
+    assert "signature" not in json.loads(dest.read_text())
+    assert (tmp_path / "godscore.json.sig").read_text() == "\n"
+
+
+def test_verify_attestation_accepts_own_signature(tmp_path, monkeypatch, capsys):
+    import verify_attestation
+
+    src = tmp_path / "out.json"
+    src.write_text(json.dumps(OUTPUT))
+    dest = tmp_path / "godscore.json"
+    monkeypatch.setenv("GODSCORE_ATTESTATION_HMAC", "s3cret")
+    assert build_attestation.main(["build_attestation.py", str(src), str(dest)]) == 0
+
+    assert verify_attestation.main(["verify_attestation.py", str(dest), "s3cret"]) == 0
+    assert verify_attestation.main(["verify_attestation.py", str(dest), "wrong"]) == 1
+    assert capsys.readouterr().out.splitlines()[-2:] == ["✅ Signature valid", "❌ Signature invalid"]
+
+
+def test_verify_attestation_rejects_malformed_base64(tmp_path, capsys):
+    import verify_attestation
+
+    dest = tmp_path / "godscore.json"
+    dest.write_text(json.dumps({"producer": "godscore-ci", "signature": {"value": "not base64!"}}))
+    assert verify_attestation.main(["verify_attestation.py", str(dest), "s3cret"]) == 1
+    assert "Signature invalid" in capsys.readouterr().out
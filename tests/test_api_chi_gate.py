@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+import chi_gate
+
+POLICIES = {
+    "policies": [
+        {"id": "p.low", "tier": 1},
+        {"id": "p.high", "tier": 3},
+    ]
+}
+
+
+@pytest.fixture
+def gate_env(tmp_path, monkeypatch):
+    policy = tmp_path / "policy.json"
+    policy.write_text(json.dumps(POLICIES))
+    monkeypatch.setenv("GODSCORE_POLICY_PATH", str(policy))
+    monkeypatch.setenv("GODSCORE_CHI_ENFORCE", "true")
+    for name in ("GODSCORE_CHI_ALLOW_UNKNOWN", "GODSCORE_CHI_MIN_TIER", "GODSCORE_CHI_FAST_FAIL"):
+        monkeypatch.delenv(name, raising=False)
+    return tmp_path
+
+
+def _output(tmp_path: Path, status: str, drift_ids) -> str:
+    out = tmp_path / "out.json"
+    metrics = {"chi_status": status, "chi_ratio": 0.5, "chi_drift_policy_ids": drift_ids}
+    out.write_text(json.dumps({"context": {"repo": "r", "sha": "s"}, "outputs": {"metrics": metrics}}))
+    return str(out)
+
+
+def test_enforce_disabled_passes_without_reading_output(gate_env, monkeypatch, capsys):
+    monkeypatch.setenv("GODSCORE_CHI_ENFORCE", "false")
+    assert chi_gate.main(["chi_gate.py", str(gate_env / "missing.json")]) == 0
+    assert "enforcement disabled -> PASS" in capsys.readouterr().out
+
+
+def test_drift_at_min_tier_fails(gate_env, capsys):
+    out = _output(gate_env, "drifting", ["p.low", "p.high"])
+    assert chi_gate.main(["chi_gate.py", out]) == 1
+    stdout = capsys.readouterr().out
+    assert " - p.high (tier 3)" in stdout
+    assert "p.low (tier" not in stdout
+
+
+def test_drift_below_min_tier_passes_and_notes_unknown(gate_env, capsys):
+    out = _output(gate_env, "drifting", ["p.low", "p.missing", 7, ""])
+    assert chi_gate.main(["chi_gate.py", out]) == 0
+    stdout = capsys.readouterr().out
+    assert "PASS: drifting only below min tier" in stdout
+    assert " - p.missing" in stdout
+
+
+@pytest.mark.parametrize("status", ["honest", "unknown"])
+def test_not_drifting_passes(gate_env, status):
+    assert chi_gate.main(["chi_gate.py", _output(gate_env, status, ["p.high"])]) == 0
+
+
+def test_unknown_status_without_allowance_is_not_drifting(gate_env, monkeypatch):
+    monkeypatch.setenv("GODSCORE_CHI_ALLOW_UNKNOWN", "false")
+    assert chi_gate.main(["chi_gate.py", _output(gate_env, "unknown", ["p.high"])]) == 0
+
+
+def test_fast_fail_stops_at_first_hit(gate_env, monkeypatch, capsys):
+    monkeypatch.setenv("GODSCORE_CHI_FAST_FAIL", "true")
+    monkeypatch.setenv("GODSCORE_CHI_MIN_TIER", "1")
+    out = _output(gate_env, "drifting", ["p.low", "p.high"])
+    assert chi_gate.main(["chi_gate.py", out]) == 1
+    stdout = capsys.readouterr().out
+    assert " - p.low (tier 1)" in stdout
+    assert "p.high (tier" not in stdout
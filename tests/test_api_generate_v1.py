@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import json
+import sys
+
+import pytest
+
+import generate_v1
+
+POLICIES = {
+    "policies": [
+        {"id": "p.low", "tier": 1},
+        {"id": "p.high", "tier": "3"},
+        {"id": "p.zero"},
+    ]
+}
+
+
+@pytest.fixture
+def policy_env(tmp_path, monkeypatch):
+    policy = tmp_path / "policy.json"
+    policy.write_text(json.dumps(POLICIES))
+    monkeypatch.setenv("GODSCORE_POLICY_PATH", str(policy))
+    return tmp_path
+
+
+def test_extend_with_tiers_groups_drift_by_tier(policy_env):
+    data = {"outputs": {"metrics": {"chi_drift_policy_ids": ["p.high", "p.low", "p.missing"]}}}
+    generate_v1.extend_with_tiers(data)
+    metrics = data["outputs"]["metrics"]
+
+    assert metrics["chi_drift_by_tier"] == {"3": ["p.high"], "1": ["p.low"], "0": ["p.missing"]}
+    assert metrics["chi_max_drift_tier"] == 3
+    assert metrics["chi_enforced_tiers"] == [0, 1, 3]
+    assert metrics["chi_status"] == "unknown"
+
+
+def test_full_generation_writes_contract_surface(policy_env, monkeypatch):
+    src = policy_env / "in.json"
+    out = policy_env / "out.json"
+    src.write_text(json.dumps({"version": "1.0.0", "outputs": {}}))
+
+    monkeypatch.setattr(sys, "argv", ["generate_v1.py", str(src), str(out)])
+    generate_v1.main()
+
+    data = json.loads(out.read_text())
+    assert data["generated_at"].endswith("Z")
+    assert data["outputs"]["metrics"]["chi_drift_count"] == 0
+    assert data["outputs"]["metrics"]["chi_enforced_tiers"] == [0, 1, 3]
+
+
+def test_save_json_compact_when_pretty_disabled(tmp_path, monkeypatch):
+    out = tmp_path / "out.json"
+    monkeypatch.setenv("GODSCORE_PRETTY", "0")
+    generate_v1.save_json(str(out), {"a": [1, 2]})
+    assert out.read_text() == '{"a":[1,2]}\n'
+
+    monkeypatch.delenv("GODSCORE_PRETTY")
+    generate_v1.save_json(str(out), {"a": [1, 2]})
+    assert json.loads(out.read_text()) == {"a": [1, 2]}
+    assert "\n  " in out.read_text()
+
+
+def test_non_finite_floats_round_trip_like_stdlib(policy_env, monkeypatch):
+    src = policy_env / "in.json"
+    out = policy_env / "out.json"
+    src.write_text('{"outputs": {"metrics": {"chi_ratio": NaN, "x": [Infinity]}}}')
+
+    monkeypatch.setattr(sys, "argv", ["generate_v1.py", str(src), str(out)])
+    generate_v1.main()
+
+    text = out.read_text()
+    assert '"chi_ratio": NaN' in text
+    assert "Infinity" in text
+
+
+@pytest.mark.parametrize("pretty", ["1", "0"])
+def test_integers_beyond_64_bits_round_trip_exactly(policy_env, monkeypatch, pretty):
+    big = 123456789012345678901234567890
+    src = policy_env / "in.json"
+    out = policy_env / "out.json"
+    # Padding pushes the input past MMAP_MIN_BYTES, so the mmapped load runs.
+    src.write_text(json.dumps({"outputs": {"metrics": {"a": big, "b": -(2**64)}}, "pad": "x" * 70000}))
+
+    monkeypatch.setenv("GODSCORE_PRETTY", pretty)
+    monkeypatch.setattr(sys, "argv", ["generate_v1.py", str(src), str(out)])
+    generate_v1.main()
+
+    metrics = json.loads(out.read_text())["outputs"]["metrics"]
+    assert metrics["a"] == big and type(metrics["a"]) is int
+    assert metrics["b"] == -(2**64)
+
+
+def test_save_json_is_atomic(tmp_path, monkeypatch):
+    out = tmp_path / "out.json"
+    generate_v1.save_json(str(out), {"ok": True})
+
+    def boom(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(generate_v1._fastjson.os, "replace", boom)
+    with pytest.raises(OSError):
+        generate_v1.save_json(str(out), {"ok": False})
+
+    assert json.loads(out.read_text()) == {"ok": True}
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out.json"]
+
+
+def test_validate_flag_refuses_to_write_broken_contract(policy_env, monkeypatch):
+    src = policy_env / "in.json"
+    out = policy_env / "out.json"
+    src.write_text(json.dumps({"outputs": {"metrics": {"chi_status": 3}}}))
+
+    monkeypatch.setenv("GODSCORE_VALIDATE", "1")
+    monkeypatch.setattr(sys, "argv", ["generate_v1.py", str(src), str(out)])
+    with pytest.raises(SystemExit):
+        generate_v1.main()
+    assert not out.exists()
+
+
+@pytest.mark.parametrize("pretty", ["0", "1"])
+def test_save_json_stdlib_fallback_writes_utf8(tmp_path, monkeypatch, pretty):
+    monkeypatch.setattr(generate_v1._fastjson, "orjson", None)
+    monkeypatch.setenv("GODSCORE_PRETTY", pretty)
+    out = tmp_path / "out.json"
+    generate_v1.save_json(str(out), {"note": "café ✓"})
+    assert "café ✓" in out.read_text(encoding="utf-8")
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import _policy_cache
+
+
+def _write_policies(path: Path, ids) -> None:
+    path.write_text(json.dumps({"policies": [{"id": i, "tier": 1} for i in ids] + ["junk"]}))
+
+
+def test_load_policies_drops_non_objects_and_invalidates(tmp_path):
+    policy = tmp_path / "policy.json"
+    _write_policies(policy, ["a"])
+    assert _policy_cache.load_policies(str(policy)) == [{"id": "a", "tier": 1}]
+
+    _write_policies(policy, ["a", "b"])
+    st = policy.stat()
+    os.utime(policy, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert [p["id"] for p in _policy_cache.load_policies(str(policy))] == ["a", "b"]
+
+
+def test_load_policies_writes_nothing_to_disk(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    policy = tmp_path / "policy.json"
+    _write_policies(policy, ["a"])
+
+    _policy_cache.load_policies(str(policy))
+    assert sorted(os.listdir(tmp_path)) == ["policy.json"]
+
+
+def test_repeat_load_in_process_skips_disk(tmp_path, monkeypatch):
+    policy = tmp_path / "policy.json"
+    _write_policies(policy, ["a"])
+    first = _policy_cache.load_policies(str(policy))
+
+    def no_parse(path):
+        raise AssertionError("policy file parsed twice")
+
+    monkeypatch.setattr(_policy_cache._fastjson, "load_file", no_parse)
+    assert _policy_cache.load_policies(str(policy)) is first
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import json
+
+import render_summary
+
+OUTPUT = {
+    "version": "1.0.0",
+    "generated_at": "2026-01-01T00:00:00Z",
+    "context": {"repo": "o/r", "sha": "abc"},
+    "outputs": {
+        "metrics": {
+            "chi_status": "drifting",
+            "chi_ratio": 0.5,
+            "chi_policy_count": 2,
+            "chi_enforced_count": 1,
+            "chi_drift_count": 1,
+            "chi_drift_policy_ids": ["p.high"],
+        },
+        "todos": [{"title": "fix it", "priority": "high"}, "junk"],
+    },
+}
+
+
+def test_console_summary(tmp_path, monkeypatch, capsys):
+    out = tmp_path / "out.json"
+    out.write_text(json.dumps(OUTPUT))
+    monkeypatch.delenv("GITHUB_STEP_SUMMARY", raising=False)
+
+    assert render_summary.main(["render_summary.py", str(out)]) == 0
+    stdout = capsys.readouterr().out
+    assert "repo:         o/r" in stdout
+    assert "ratio:        0.500" in stdout
+    assert " - p.high" in stdout
+    assert " - [open] (high) fix it" in stdout
+
+
+def test_malformed_sections_fall_back_to_defaults(tmp_path, monkeypatch, capsys):
+    out = tmp_path / "out.json"
+    out.write_text(json.dumps({"context": "nope", "outputs": {"metrics": [], "todos": {}}}))
+    monkeypatch.delenv("GITHUB_STEP_SUMMARY", raising=False)
+
+    assert render_summary.main(["render_summary.py", str(out)]) == 0
+    stdout = capsys.readouterr().out
+    assert "repo:         unknown" in stdout
+    assert "status:       unknown" in stdout
+    assert " - none" in stdout
+
+
+def test_step_summary_markdown(tmp_path, monkeypatch):
+    out = tmp_path / "out.json"
+    out.write_text(json.dumps(OUTPUT))
+    summary = tmp_path / "summary.md"
+    summary.write_text("previous\n")
+    monkeypatch.setenv("GITHUB_STEP_SUMMARY", str(summary))
+
+    assert render_summary.main(["render_summary.py", str(out)]) == 0
+    text = summary.read_text(encoding="utf-8")
+    assert text.startswith("previous\n## 🧭 GodScore CI Summary\n\n")
+    assert "| Status | **drifting** |\n" in text
+    assert "- `p.high`\n" in text
+    assert "- **[open] (high)** fix it\n" in text
+    assert text.endswith("\n---\n")
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import validate_v1
+
+ROOT = Path(__file__).resolve().parents[1]
+VALIDATOR = ROOT / "api" / "validate_v1.py"
+SCHEMA = ROOT / "api" / "schema.v1.json"
+
+
+def _metrics(**overrides):
+    metrics = {
+        "chi_drift_count": 0,
+        "chi_ratio": 1.0,
+        "chi_status": "honest",
+        "chi_drift_policy_ids": [],
+    }
+    metrics.update(overrides)
+    return metrics
+
+
+def _run(tmp_path: Path, payload, cache_dir: str = "") -> subprocess.CompletedProcess:
+    return _run_text(tmp_path, json.dumps(payload), cache_dir)
+
+
+def _run_text(tmp_path: Path, text: str, cache_dir: str = "") -> subprocess.CompletedProcess:
+    out = tmp_path / "out.json"
+    out.write_text(text, encoding="utf-8")
+    return subprocess.run(
+        [sys.executable, str(VALIDATOR), str(SCHEMA), str(out)],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "GODSCORE_CACHE_DIR": cache_dir},
+    )
+
+
+def test_valid_payload_passes(tmp_path):
+    res = _run(tmp_path, {"outputs": {"metrics": _metrics(chi_max_drift_tier=2)}})
+    assert res.returncode == 0
+    assert "validation passed" in res.stdout
+
+
+def test_bool_counts_as_int_like_before(tmp_path):
+    res = _run(tmp_path, {"outputs": {"metrics": _metrics(chi_drift_count=True)}})
+    assert res.returncode == 0
+
+
+@pytest.mark.parametrize(
+    "payload, message",
+    [
+        ({}, "Missing required key: outputs"),
+        ({"outputs": {"metrics": {}}}, "Missing required metrics.chi_drift_count"),
+        (
+            {"outputs": {"metrics": {"chi_drift_count": "0", "chi_ratio": 1.0}}},
+            "metrics.chi_drift_count must be",
+        ),
+        ({"outputs": {"metrics": _metrics(signal_count="3")}}, "metrics.signal_count must be"),
+        ({"outputs": {"metrics": _metrics(chi_drift_count=1.0)}}, "metrics.chi_drift_count must be"),
+        ({"outputs": {"metrics": _metrics(chi_max_drift_tier=2.0)}}, "metrics.chi_max_drift_tier must be"),
+    ],
+)
+def test_invalid_payload_reports_first_violation(tmp_path, payload, message):
+    res = _run(tmp_path, payload)
+    assert res.returncode == 1
+    assert message in res.stdout
+
+
+def test_generated_at_is_not_constrained(tmp_path):
+    # Forward-compatible surface: only outputs.metrics is part of the contract.
+    for stamp in ("2026-01-31T00:00:00", "2026-01-31 00:00:00Z", "yesterday", 0):
+        res = _run(tmp_path, {"generated_at": stamp, "outputs": {"metrics": _metrics()}})
+        assert res.returncode == 0
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"outputs": {"metrics": _metrics(chi_status=5)}, "outputs.metrics": _metrics()},
+        {"outputs": {"metrics": _metrics(chi_status=5), "x": {"metrics": _metrics()}}},
+        {"outputs": {"metrics": _metrics(chi_status=5)}, "x": {"outputs": {"metrics": _metrics()}}},
+    ],
+)
+def test_dotted_or_nested_lookalike_keys_do_not_replace_metrics(tmp_path, payload):
+    res = _run(tmp_path, payload)
+    assert res.returncode == 1
+    assert "metrics.chi_status must be" in res.stdout
+
+
+@pytest.mark.skipif(validate_v1.ijson is None, reason="ijson not installed")
+def test_surface_matches_full_parse(tmp_path):
+    payload = {
+        "version": "1.0.0",
+        "generated_at": "ISO-8601",
+        "inputs": {"signals": [{"id": "s", "tags": [1, {"a": []}]}]},
+        "outputs": {"explanations": [{"x": 1}], "metrics": _metrics(chi_drift_by_tier={"2": ["p"]}), "score": 3},
+    }
+    out = tmp_path / "out.json"
+    out.write_text(json.dumps(payload))
+    assert validate_v1.load_contract_surface(str(out)) == {
+        "outputs": {"metrics": payload["outputs"]["metrics"]},
+    }
+
+
+def test_non_finite_floats_pass_like_stdlib(tmp_path):
+    # generate_v1 writes NaN/Infinity the way stdlib json does; they are floats.
+    for value in ("NaN", "Infinity", "-Infinity"):
+        text = json.dumps({"outputs": {"metrics": _metrics(chi_ratio=0.5)}}).replace("0.5", value)
+        res = _run_text(tmp_path, text)
+        assert res.returncode == 0, res.stdout + res.stderr
+        assert "validation passed" in res.stdout
+
+
+def test_trailing_data_is_rejected(tmp_path):
+    text = json.dumps({"outputs": {"metrics": _metrics()}})
+    for tail in (" garbage", " {}", "]"):
+        res = _run_text(tmp_path, text + tail)
+        assert res.returncode != 0
+        assert "validation passed" not in res.stdout
+
+
+def test_passed_output_is_cached_by_content(tmp_path):
+    cache = str(tmp_path / "cache")
+    good = {"outputs": {"metrics": _metrics()}}
+
+    assert _run(tmp_path, good, cache).stdout.strip().endswith("passed")
+    assert "passed (cached)" in _run(tmp_path, good, cache).stdout
+
+    bad = {"outputs": {"metrics": _metrics(chi_status=1)}}
+    assert _run(tmp_path, bad, cache).returncode == 1
+    assert _run(tmp_path, bad, cache).returncode == 1
+
+
+def test_cache_is_off_unless_configured(tmp_path):
+    good = {"outputs": {"metrics": _metrics()}}
+    assert _run(tmp_path, good).stdout.strip().endswith("passed")
+    assert _run(tmp_path, good).stdout.strip().endswith("passed")
+
+
+def test_cache_dir_writable_by_others_is_ignored(tmp_path):
+    cache = tmp_path / "cache"
+    cache.mkdir()
+    cache.chmod(0o777)
+    good = {"outputs": {"metrics": _metrics()}}
+
+    _run(tmp_path, good, str(cache))
+    assert _run(tmp_path, good, str(cache)).stdout.strip().endswith("passed")
+    assert list(cache.iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"outputs": {"metrics": _metrics()}},
+        {"generated_at": "ISO-8601", "outputs": {"metrics": _metrics(chi_drift_count=True)}},
+        {"generated_at": "yesterday", "outputs": {"metrics": _metrics()}},
+        {"outputs": {"metrics": _metrics(chi_ratio="1")}},
+        {"outputs": {"metrics": _metrics(chi_enforced_tiers={})}},
+        {"outputs": {"metrics": _metrics(chi_drift_count=1.0)}},
+        {"outputs": {"metrics": _metrics(signal_count=3.0, chi_policy_count=2.0)}},
+        {"outputs": {"metrics": {"chi_status": "honest"}}},
+        {"outputs": []},
+        {},
+    ],
+)
+def test_compiled_validator_agrees_with_validate(payload):
+    try:
+        validate_v1.validate(payload)
+        passed = True
+    except SystemExit:
+        passed = False
+    assert validate_v1.get_validator("v1")(payload) is passed
+
+
+def test_get_validator_is_memoized():
+    accepts = validate_v1.get_validator("v1")
+    assert validate_v1.get_validator() is accepts
+    assert accepts({"outputs": {"metrics": _metrics()}}) is True
+    assert accepts({"outputs": {}}) is False
+    with pytest.raises(ValueError):
+        validate_v1.get_validator("v0")
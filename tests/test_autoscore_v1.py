@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+
+import pytest
+
+import autoscore_v1
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(repo, *args) -> str:
+    return subprocess.check_output(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args], cwd=repo, text=True
+    ).strip()
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "README.md").write_text("hello\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-qm", "init")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("GITHUB_SHA", raising=False)
+    monkeypatch.delenv("GITHUB_EVENT_BEFORE", raising=False)
+    return tmp_path
+
+
+def test_previous_commit_is_default_base(repo):
+    (repo / "api").mkdir()
+    (repo / "api" / "x.py").write_text("a = 1\nb = 2\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-qm", "WIP add api")
+
+    result = autoscore_v1.compute_autoscore_v1()
+    assert result.signals["base"] == _git(repo, "rev-parse", "HEAD~1")
+    assert result.signals["added"] == 2
+    assert result.signals["risky_paths"] is True
+    assert "Commit message suggests WIP/tmp/draft." in result.notes
+
+
+def test_single_commit_repo_falls_back_to_head(repo):
+    result = autoscore_v1.compute_autoscore_v1()
+    assert result.signals["base"] == "HEAD"
+    assert result.signals["changed_loc"] == 0
+    assert result.penalties == {"diff_risk": 0.05, "path_risk": 0.0, "process_risk": 0.0}